@@ -0,0 +1,92 @@
+"""
+The verifier must give one verdict per bundle, whichever JSON parser is
+installed: orjson if available, the stdlib json fallback otherwise.
+
+Run with:  python -m unittest discover tests
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "verifier"))
+
+import verify  # noqa: E402
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+META = json.dumps({
+    "bundle_id": "evb-test",
+    "version": "0.1",
+    "timestamp": "2025-11-19T12:34:56Z",
+    "system_info": {"name": "n", "version": "v", "operator": "o"},
+}).encode("utf-8")
+
+ENTRY = '{"timestamp":"2025-11-19T12:34:56Z","actor":"a","action":"b","input":%s}'
+
+
+def entry(value: str) -> bytes:
+    return (ENTRY % value).encode("utf-8")
+
+
+# AAL lines that orjson rejects; the stdlib fallback must reject them too
+INVALID_LINES = {
+    "bad UTF-8": entry('""')[:-2] + b'\xff\xfe"}',
+    "encoded surrogate": entry('""')[:-2] + b'\xed\xa0\x80"}',
+    "UTF-8 BOM": b"\xef\xbb\xbf" + entry("1"),
+    "UTF-16": (ENTRY % "1").encode("utf-16"),
+    "NaN": entry("NaN"),
+    "lone surrogate": entry('"\\ud800"'),
+    "float overflow": entry("1e400"),
+    "integer overflow": entry("1" + "0" * 400),
+}
+
+VALID_LINE = entry('{"eta": 1.5, "big": 12345678901234567890, "s": "\\ud83d\\ude00"}')
+
+
+def verify_with(loads, aal_line: bytes) -> verify.VerificationResult:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bundle.zip"
+        with zipfile.ZipFile(path, "w") as z:
+            z.writestr("meta.json", META)
+            z.writestr("aal.ndjson", aal_line + b"\n")
+        with mock.patch.object(verify, "_loads", loads):
+            return verify.verify_bundle(path)
+
+
+class StdlibFallbackTest(unittest.TestCase):
+
+    def test_invalid_lines_are_rejected(self):
+        for name, line in INVALID_LINES.items():
+            with self.subTest(name):
+                result = verify_with(verify._json_loads, line)
+                self.assertEqual(result.aal.errors, ["❌ AAL line 1: invalid JSON"])
+
+    def test_valid_line_passes(self):
+        result = verify_with(verify._json_loads, VALID_LINE)
+        self.assertEqual(result.aal.errors, [])
+        self.assertEqual(result.aal.score, 4)
+
+
+@unittest.skipIf(orjson is None, "orjson not installed")
+class ParserBackendTest(unittest.TestCase):
+
+    def test_same_verdict_with_both_parsers(self):
+        for name, line in {**INVALID_LINES, "valid": VALID_LINE}.items():
+            with self.subTest(name):
+                fast = verify_with(orjson.loads, line)
+                stdlib = verify_with(verify._json_loads, line)
+                self.assertEqual(stdlib.aal.errors, fast.aal.errors)
+                self.assertEqual(stdlib.total_score, fast.total_score)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,25 +12,88 @@ L1 checks:
 
 import sys
 import hashlib
+import io
+import math
+import mmap
+import re
 import zipfile
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, Optional
 from dataclasses import dataclass, field
 
+# A \uD800-\uDFFF escape; only lines containing one can hold a lone surrogate
+_SURROGATE_ESCAPE_RE = re.compile(rb"\\u[dD][89a-fA-F]")
+
+# 309+ digits in a row; only lines containing one can hold an integer too
+# large for a double
+_HUGE_INT_RE = re.compile(rb"\d{309}")
+
+
+def _reject_constant(name: str) -> Any:
+    raise ValueError(f"{name} is not valid JSON")
+
+
+def _finite_float(literal: str) -> float:
+    value = float(literal)
+    if math.isinf(value):
+        raise ValueError(f"number out of range: {literal[:20]}")
+    return value
+
+
+def _finite_int(literal: str) -> int:
+    if math.isinf(float(literal)):
+        raise ValueError(f"number out of range: {literal[:20]}")
+    return int(literal)
+
+
+def _json_loads(data: bytes) -> Any:
+    """
+    json.loads held to orjson's strictness, so a bundle gets the same
+    verdict whichever parser is installed: anything but UTF-8 (UTF-16, a
+    BOM, encoded surrogates), NaN / Infinity, numbers too large for a
+    double and lone surrogate escapes (e.g. "\\ud800") are rejected.
+    """
+    try:
+        obj = json.loads(
+            data.decode("utf-8"),  # strict: json.loads(bytes) also takes UTF-16 / BOMs
+            parse_constant=_reject_constant,
+            parse_float=_finite_float,
+            parse_int=_finite_int if _HUGE_INT_RE.search(data) else None,
+        )
+    except RecursionError:  # report one bad line, don't abort the bundle
+        raise ValueError("JSON nested too deeply") from None
+    if _SURROGATE_ESCAPE_RE.search(data):
+        try:
+            json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        except UnicodeEncodeError:
+            raise ValueError("lone surrogate escape in string") from None
+    return obj
+
+
+try:  # optional: orjson parses meta.json / AAL lines several times faster
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = _json_loads
+
 
 # ============================================================
 # Constants (aligned with spec and JSON Schemas)
 # ============================================================
 
 # Required fields in meta.json (spec / meta.schema.json)
-REQUIRED_META_FIELDS = ["bundle_id", "version", "timestamp", "system_info"]
+REQUIRED_META_FIELDS = ("bundle_id", "version", "timestamp", "system_info")
+_REQUIRED_META_SET = frozenset(REQUIRED_META_FIELDS)
 
 # Recommended fields inside system_info (optional but checked if present)
-REQUIRED_SYSTEM_INFO_FIELDS = ["name", "version", "operator"]
+REQUIRED_SYSTEM_INFO_FIELDS = ("name", "version", "operator")
+_REQUIRED_SYSTEM_INFO_SET = frozenset(REQUIRED_SYSTEM_INFO_FIELDS)
 
 # Required fields for each AAL entry (spec / aal-entry.schema.json)
-REQUIRED_AAL_FIELDS = ["timestamp", "actor", "action"]
+REQUIRED_AAL_FIELDS = ("timestamp", "actor", "action")
+_REQUIRED_AAL_SET = frozenset(REQUIRED_AAL_FIELDS)
 
 # Evidence Bundle format version
 VALID_EVB_VERSION = "0.1"
@@ -38,6 +101,25 @@ VALID_EVB_VERSION = "0.1"
 # AAL version (if present)
 VALID_AAL_VERSION = "1.0"
 
+# ISO 8601 / RFC 3339 date-time with offset, e.g. 2025-11-19T12:34:56Z
+ISO_8601_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})",
+    re.ASCII,
+)
+
+# Signature-like member names: contain "ctk" or "signature" (any case)
+SIGNATURE_NAME_RE = re.compile(r"ctk|signature", re.IGNORECASE)
+
+# verify_aal gives up after this many invalid lines; bounds the work spent
+# on a log that is clearly broken
+MAX_AAL_ERRORS = 100
+
+# Read buffer size when streaming aal.ndjson out of the ZIP
+STREAM_BUFFER_SIZE = 64 * 1024
+
+# Read size for hashing bundles when hashlib.file_digest is unavailable
+HASH_CHUNK_SIZE = 1024 * 1024
+
 
 # ============================================================
 # Result Types
@@ -49,6 +131,7 @@ class CheckResult:
     score: int = 0
     warnings: list[str] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
+    skipped: bool = False  # check not run (scores 0, no errors of its own)
 
     def add_warning(self, msg: str, penalty: int = 1) -> None:
         self.warnings.append(msg)
@@ -75,24 +158,19 @@ class VerificationResult:
         return max(0, int(base))
 
     @property
-    def all_warnings(self) -> list[str]:
-        result: list[str] = []
-        result.extend(self.meta.warnings)
-        result.extend(self.aal.warnings)
-        result.extend(self.optional.warnings)
+    def checks(self) -> tuple[CheckResult, ...]:
+        """The individual check results, in report order."""
         if self.hash_check:
-            result.extend(self.hash_check.warnings)
-        return result
+            return (self.meta, self.aal, self.optional, self.hash_check)
+        return (self.meta, self.aal, self.optional)
+
+    @property
+    def all_warnings(self) -> list[str]:
+        return [w for check in self.checks for w in check.warnings]
 
     @property
     def all_errors(self) -> list[str]:
-        result: list[str] = []
-        result.extend(self.meta.errors)
-        result.extend(self.aal.errors)
-        result.extend(self.optional.errors)
-        if self.hash_check:
-            result.extend(self.hash_check.errors)
-        return result
+        return [e for check in self.checks for e in check.errors]
 
     @property
     def is_valid(self) -> bool:
@@ -101,40 +179,79 @@ class VerificationResult:
         - total_score >= 7
         - no critical errors
         """
-        return self.total_score >= 7 and not self.all_errors
+        return self.total_score >= 7 and not any(check.errors for check in self.checks)
 
 
 # ============================================================
 # Verification Functions
 # ============================================================
 
-def verify_meta(z: zipfile.ZipFile) -> CheckResult:
+def is_iso8601(ts: object) -> bool:
+    """True if `ts` is a string shaped like an ISO 8601 date-time with offset."""
+    return isinstance(ts, str) and ISO_8601_RE.fullmatch(ts) is not None
+
+
+def in_spec_order(fields: tuple[str, ...], missing: frozenset[str]) -> list[str]:
+    """The `missing` field names, listed in spec order (as given by `fields`)."""
+    return [f for f in fields if f in missing]
+
+
+def iter_aal_lines(
+    z: zipfile.ZipFile, info: zipfile.ZipInfo, result: CheckResult
+) -> Iterator[bytes]:
+    """
+    Stream the non-empty lines of aal.ndjson (`info`), one at a time.
+
+    Only one buffer and one line are held in memory, however large the
+    log is. A read failure (e.g. corrupt deflate data or a CRC mismatch)
+    is recorded on `result` and ends the stream.
+    """
+    try:
+        with z.open(info) as fh:
+            for line in io.BufferedReader(fh, STREAM_BUFFER_SIZE):
+                if line.strip():
+                    yield line
+    except Exception as e:
+        result.add_error(f"❌ aal.ndjson read error: {e}")
+
+
+def verify_meta(z: zipfile.ZipFile) -> tuple[CheckResult, Optional[dict]]:
     """
     Verify meta.json:
     - Exists
     - Has required fields
     - Version / timestamp / system_info sanity
+
+    Returns the check result and the parsed meta.json (None if it could
+    not be read), so later stages don't read and parse it again.
     """
     result = CheckResult(score=4)  # full score for meta: 4
 
-    if "meta.json" not in z.namelist():
+    try:
+        info = z.getinfo("meta.json")
+    except KeyError:
         result.add_error("❌ meta.json missing")
-        return result
+        return result, None
 
     try:
-        raw = z.read("meta.json").decode("utf-8")
-        meta = json.loads(raw)
-    except json.JSONDecodeError as e:
+        meta = _loads(z.read(info))  # bytes: no separate decode pass
+    except ValueError as e:  # JSONDecodeError (json or orjson) or invalid UTF-8
         result.add_error(f"❌ meta.json invalid JSON: {e}")
-        return result
+        return result, None
     except Exception as e:
         result.add_error(f"❌ meta.json read error: {e}")
-        return result
+        return result, None
+
+    if not isinstance(meta, dict):
+        result.add_error("❌ meta.json must be a JSON object")
+        return result, None
 
     # Required fields (bundle_id / version / timestamp / system_info)
-    missing = [f for f in REQUIRED_META_FIELDS if f not in meta]
+    missing = _REQUIRED_META_SET - meta.keys()
     if missing:
-        result.add_error(f"❌ meta.json missing required fields: {missing}")
+        result.add_error(
+            f"❌ meta.json missing required fields: {in_spec_order(REQUIRED_META_FIELDS, missing)}"
+        )
 
     # Version must be "0.1"
     if "version" in meta and meta["version"] != VALID_EVB_VERSION:
@@ -142,10 +259,10 @@ def verify_meta(z: zipfile.ZipFile) -> CheckResult:
             f"⚠ version mismatch (expected: '{VALID_EVB_VERSION}', got: '{meta['version']}')"
         )
 
-    # Basic timestamp format check (very loose)
+    # Timestamp must be an ISO 8601 date-time with offset (Z or +hh:mm)
     if "timestamp" in meta:
         ts = meta["timestamp"]
-        if not isinstance(ts, str) or "T" not in ts:
+        if not is_iso8601(ts):
             result.add_warning(
                 "⚠ timestamp should be ISO 8601 (e.g. 2025-11-19T12:34:56Z)"
             )
@@ -155,14 +272,14 @@ def verify_meta(z: zipfile.ZipFile) -> CheckResult:
         if not isinstance(meta["system_info"], dict):
             result.add_warning("⚠ system_info should be an object")
         else:
-            sys_missing = [
-                f for f in REQUIRED_SYSTEM_INFO_FIELDS
-                if f not in meta["system_info"]
-            ]
+            sys_missing = _REQUIRED_SYSTEM_INFO_SET - meta["system_info"].keys()
             if sys_missing:
-                result.add_warning(f"⚠ system_info missing fields: {sys_missing}")
+                result.add_warning(
+                    "⚠ system_info missing fields: "
+                    f"{in_spec_order(REQUIRED_SYSTEM_INFO_FIELDS, sys_missing)}"
+                )
 
-    return result
+    return result, meta
 
 
 def verify_aal(z: zipfile.ZipFile) -> CheckResult:
@@ -175,41 +292,45 @@ def verify_aal(z: zipfile.ZipFile) -> CheckResult:
     """
     result = CheckResult(score=4)
 
-    if "aal.ndjson" not in z.namelist():
-        result.add_error("❌ aal.ndjson missing")
-        return result
-
     try:
-        raw = z.read("aal.ndjson").decode("utf-8")
-    except Exception as e:
-        result.add_error(f"❌ aal.ndjson read error: {e}")
-        return result
-
-    lines = [line for line in raw.split("\n") if line.strip()]
-
-    if not lines:
-        result.add_warning("⚠ aal.ndjson is empty", penalty=2)
+        info = z.getinfo("aal.ndjson")
+    except KeyError:
+        result.add_error("❌ aal.ndjson missing")
         return result
 
     error_count = 0
     warning_count = 0
+    stopped_at = 0
+    i = 0
+    loads = _loads  # local lookup in the per-line loop
+
+    for i, line in enumerate(iter_aal_lines(z, info, result), start=1):
+        if error_count >= MAX_AAL_ERRORS:
+            stopped_at = i
+            break
 
-    for i, line in enumerate(lines, start=1):
         try:
-            entry = json.loads(line)
-        except json.JSONDecodeError:
+            entry = loads(line)
+        except ValueError:  # JSONDecodeError (json or orjson) or invalid UTF-8
             error_count += 1
             if error_count <= 3:  # limit detailed errors
                 result.add_error(f"❌ AAL line {i}: invalid JSON", penalty=1)
             continue
 
+        if not isinstance(entry, dict):
+            error_count += 1
+            if error_count <= 3:
+                result.add_error(f"❌ AAL line {i}: not a JSON object", penalty=1)
+            continue
+
         # Required fields (timestamp / actor / action)
-        missing = [f for f in REQUIRED_AAL_FIELDS if f not in entry]
+        missing = _REQUIRED_AAL_SET - entry.keys()
         if missing:
             warning_count += 1
             if warning_count <= 5:
                 result.add_warning(
-                    f"⚠ AAL line {i}: missing fields {missing}",
+                    f"⚠ AAL line {i}: missing fields "
+                    f"{in_spec_order(REQUIRED_AAL_FIELDS, missing)}",
                     penalty=0
                 )
 
@@ -223,16 +344,19 @@ def verify_aal(z: zipfile.ZipFile) -> CheckResult:
                     penalty=0
                 )
 
-        # Basic timestamp sanity
-        if "timestamp" in entry:
-            ts = entry["timestamp"]
-            if not isinstance(ts, str) or "T" not in ts:
-                warning_count += 1
-                if warning_count <= 5:
-                    result.add_warning(
-                        f"⚠ AAL line {i}: timestamp not ISO 8601-like",
-                        penalty=0
-                    )
+        # Timestamp sanity: ISO 8601 date-time with offset, as in meta.json
+        if "timestamp" in entry and not is_iso8601(entry["timestamp"]):
+            warning_count += 1
+            if warning_count <= 5:
+                result.add_warning(
+                    f"⚠ AAL line {i}: timestamp not ISO 8601-like",
+                    penalty=0
+                )
+
+    if i == 0:
+        if not result.errors:  # nothing read, as opposed to a read error
+            result.add_warning("⚠ aal.ndjson is empty", penalty=2)
+        return result
 
     if error_count > 3:
         result.add_error(
@@ -240,6 +364,12 @@ def verify_aal(z: zipfile.ZipFile) -> CheckResult:
             penalty=1
         )
 
+    if stopped_at:
+        result.add_error(
+            f"❌ AAL check stopped at line {stopped_at}: too many invalid lines",
+            penalty=0
+        )
+
     if warning_count > 5:
         result.add_warning(
             f"⚠ ...and {warning_count - 5} more AAL warnings",
@@ -249,6 +379,55 @@ def verify_aal(z: zipfile.ZipFile) -> CheckResult:
     return result
 
 
+def verify_aal_fast(z: zipfile.ZipFile) -> CheckResult:
+    """
+    Structure-only variant of verify_aal for pass/fail callers (e.g. CI):
+    - File exists and is not empty
+    - First and last non-empty lines are JSON objects with required fields
+    Lines in between are not parsed.
+    """
+    result = CheckResult(score=4)
+
+    try:
+        info = z.getinfo("aal.ndjson")
+    except KeyError:
+        result.add_error("❌ aal.ndjson missing")
+        return result
+
+    lines = iter_aal_lines(z, info, result)
+    first = next(lines, None)
+    if first is None:
+        if not result.errors:
+            result.add_warning("⚠ aal.ndjson is empty", penalty=2)
+        return result
+
+    edges = [("first", first)]
+    last = None
+    for last in lines:  # read through to the end without parsing
+        pass
+    if last is not None:
+        edges.append(("last", last))
+
+    for where, line in edges:
+        try:
+            entry = _loads(line)
+        except ValueError:
+            result.add_error(f"❌ AAL {where} line: invalid JSON", penalty=1)
+            continue
+        if not isinstance(entry, dict):
+            result.add_error(f"❌ AAL {where} line: not a JSON object", penalty=1)
+            continue
+        missing = _REQUIRED_AAL_SET - entry.keys()
+        if missing:
+            result.add_warning(
+                f"⚠ AAL {where} line: missing fields "
+                f"{in_spec_order(REQUIRED_AAL_FIELDS, missing)}",
+                penalty=0
+            )
+
+    return result
+
+
 def verify_optional(z: zipfile.ZipFile) -> CheckResult:
     """
     Verify optional components (anchors/, signatures, etc.).
@@ -256,40 +435,62 @@ def verify_optional(z: zipfile.ZipFile) -> CheckResult:
     """
     result = CheckResult(score=2)
 
-    names = z.namelist()
+    # One pass over the names, stopping once both have been found:
+    # - anchors/ directory with at least one file
+    # - signature-like files: name contains "ctk" or "signature"
+    has_anchors = has_sig = False
+    for info in z.infolist():  # the archive's own list; not copied
+        name = info.filename
+        if not has_anchors and name.startswith("anchors/") and len(name) > len("anchors/"):
+            has_anchors = True
+        if not has_sig and SIGNATURE_NAME_RE.search(name):
+            has_sig = True
+        if has_anchors and has_sig:
+            break
 
-    # anchors/ directory with at least one file
-    has_anchors = any(
-        name.startswith("anchors/") and len(name) > len("anchors/")
-        for name in names
-    )
     if not has_anchors:
         result.add_warning("⚠ No anchors/ found (optional for v0.1)", penalty=1)
 
-    # signature-like files: name contains "ctk" or "signature"
-    has_sig = any(
-        "signature" in name.lower() or "ctk" in name.lower()
-        for name in names
-    )
     if not has_sig:
         result.add_warning("⚠ No cryptographic signature (optional for v0.1)", penalty=1)
 
     return result
 
 
-def verify_bundle_hash(z: zipfile.ZipFile, bundle_path: Path) -> Optional[CheckResult]:
+def sha256_file(path: Path) -> str:
+    """
+    SHA-256 hex digest of a file.
+
+    Hashes a read-only memory map of the file in one call, so the data is
+    never copied into Python buffers. Falls back to buffered reads when the
+    file cannot be mapped.
+    """
+    with open(path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        except (OSError, ValueError):  # empty file / mmap not supported
+            pass
+
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: C-level read loop
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        hasher = hashlib.sha256()
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            hasher.update(chunk)
+        return hasher.hexdigest()
+
+
+def verify_bundle_hash(meta: Optional[dict], bundle_path: Path) -> Optional[CheckResult]:
     """
     If meta.json contains bundle_sha256, verify it against the actual ZIP hash.
+    `meta` is the parsed meta.json as returned by verify_meta.
     Returns:
       - CheckResult if bundle_sha256 is present
       - None if bundle_sha256 is absent or meta.json could not be read
     """
-    try:
-        raw = z.read("meta.json").decode("utf-8")
-        meta = json.loads(raw)
-    except Exception:
-        # meta errors are already handled in verify_meta
-        return None
+    if meta is None:
+        return None  # meta errors are already handled in verify_meta
 
     if "bundle_sha256" not in meta:
         return None  # hash check is optional
@@ -298,14 +499,7 @@ def verify_bundle_hash(z: zipfile.ZipFile, bundle_path: Path) -> Optional[CheckR
     expected_hash = meta["bundle_sha256"]
 
     try:
-        hasher = hashlib.sha256()
-        with open(bundle_path, "rb") as f:
-            while True:
-                chunk = f.read(8192)
-                if not chunk:
-                    break
-                hasher.update(chunk)
-        actual_hash = hasher.hexdigest()
+        actual_hash = sha256_file(bundle_path)
     except Exception as e:
         result.add_error(f"❌ Failed to calculate bundle hash: {e}")
         return result
@@ -320,19 +514,40 @@ def verify_bundle_hash(z: zipfile.ZipFile, bundle_path: Path) -> Optional[CheckR
     return result
 
 
-def verify_bundle(path: Path) -> VerificationResult:
+def verify_bundle(path: Path, mode: str = "full") -> VerificationResult:
     """
     Top-level verification:
     - Opens the ZIP
-    - Runs meta / AAL / optional checks
+    - Runs meta / AAL / optional checks (AAL is skipped if meta.json
+      is missing or unreadable)
     - Runs bundle_sha256 check (if present)
+
+    mode="fast" only checks the first and last AAL lines (see
+    verify_aal_fast); everything else is checked as in "full".
     """
+    if mode not in ("full", "fast"):
+        raise ValueError(f"unknown verification mode: {mode!r}")
+
     try:
-        with zipfile.ZipFile(path, "r") as z:
-            meta = verify_meta(z)
-            aal = verify_aal(z)
+        with zipfile.ZipFile(path, "r") as z, ThreadPoolExecutor(max_workers=1) as pool:
+            meta, meta_dict = verify_meta(z)
+
+            if meta_dict is None:
+                # Without a usable meta.json the bundle cannot pass; skip
+                # the AAL pass, by far the most expensive check.
+                aal = CheckResult(skipped=True)
+                hash_check = None
+            elif "bundle_sha256" in meta_dict:
+                # Hashing the whole file runs in C with the GIL released, so
+                # overlap it with the AAL pass instead of running it afterwards.
+                hash_future = pool.submit(verify_bundle_hash, meta_dict, path)
+                aal = verify_aal_fast(z) if mode == "fast" else verify_aal(z)
+                hash_check = hash_future.result()
+            else:
+                aal = verify_aal_fast(z) if mode == "fast" else verify_aal(z)
+                hash_check = None  # hash check is optional
+
             optional = verify_optional(z)
-            hash_check = verify_bundle_hash(z, path)
 
             return VerificationResult(
                 meta=meta,
@@ -368,7 +583,8 @@ def verify_bundle(path: Path) -> VerificationResult:
 
 def print_result(result: VerificationResult, path: Path) -> None:
     """Pretty-print verification result for humans."""
-    print(f"🔍 Verifying: {path}\n")
+    # Collected and written once at the end instead of one print per line
+    out: list[str] = [f"🔍 Verifying: {path}\n"]
 
     # Quick summary
     checks: list[str] = []
@@ -378,7 +594,9 @@ def print_result(result: VerificationResult, path: Path) -> None:
     else:
         checks.append("✗ meta.json has errors")
 
-    if not result.aal.errors:
+    if result.aal.skipped:
+        checks.append("○ aal.ndjson not checked (meta.json unusable)")
+    elif not result.aal.errors:
         checks.append("✓ aal.ndjson valid")
     else:
         checks.append("✗ aal.ndjson has errors")
@@ -398,32 +616,33 @@ def print_result(result: VerificationResult, path: Path) -> None:
         else:
             checks.append("✓ bundle_sha256 verified")
 
-    for c in checks:
-        print(c)
+    out.extend(checks)
 
-    print("\n" + "=" * 60)
+    out.append("\n" + "=" * 60)
 
     # Errors
-    if result.all_errors:
-        print("\n❌ ERRORS:")
-        for err in result.all_errors:
-            print(f"  {err}")
+    errors = result.all_errors
+    if errors:
+        out.append("\n❌ ERRORS:")
+        out.extend(f"  {err}" for err in errors)
 
     # Warnings
-    if result.all_warnings:
-        print("\n⚠  WARNINGS:")
-        for warn in result.all_warnings:
-            print(f"  {warn}")
+    warnings = result.all_warnings
+    if warnings:
+        out.append("\n⚠  WARNINGS:")
+        out.extend(f"  {warn}" for warn in warnings)
 
     # Score & verdict
-    print(f"\n📊 Score: {result.total_score}/10\n")
+    out.append(f"\n📊 Score: {result.total_score}/10\n")
 
     if result.is_valid:
-        print("✅ L1-PASS: Bundle is valid for basic audit")
+        out.append("✅ L1-PASS: Bundle is valid for basic audit")
     elif result.total_score >= 4:
-        print("⚠️  L1-PARTIAL: Bundle has issues but may be usable")
+        out.append("⚠️  L1-PARTIAL: Bundle has issues but may be usable")
     else:
-        print("❌ L1-FAIL: Bundle fails verification")
+        out.append("❌ L1-FAIL: Bundle fails verification")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 # ============================================================
@@ -431,21 +650,28 @@ def print_result(result: VerificationResult, path: Path) -> None:
 # ============================================================
 
 def main() -> None:
-    if len(sys.argv) < 2:
+    args = sys.argv[1:]
+    mode = "full"
+    if "--fast" in args:
+        args.remove("--fast")
+        mode = "fast"
+
+    if not args:
         print("Novara Pocket Judge (Alpha)")
         print()
-        print("Usage: python3 verify.py <bundle.zip>")
+        print("Usage: python3 verify.py [--fast] <bundle.zip>")
         print()
         print("Verifies Evidence Bundles against v0.1 spec (L1 verification)")
+        print("--fast only checks the first and last AAL lines")
         sys.exit(1)
 
-    bundle_path = Path(sys.argv[1])
+    bundle_path = Path(args[0])
 
     if not bundle_path.exists():
         print(f"❌ File not found: {bundle_path}")
         sys.exit(1)
 
-    result = verify_bundle(bundle_path)
+    result = verify_bundle(bundle_path, mode=mode)
     print_result(result, bundle_path)
 
     # Exit codes: